@@ -56,6 +56,127 @@ class VariableResult(BaseModel):
     scope: str
 
 
+def _run_search(
+    cursor,
+    table: str,
+    alias: str,
+    match_column: str,
+    term: str,
+    project_id: Optional[int],
+    limit: int,
+    offset: Optional[int] = None,
+    columns: Optional[list[str]] = None,
+    filters: Optional[list[tuple[str, object]]] = None,
+    order: bool = True,
+) -> list:
+    """
+    Run a LIKE search against one code element table.
+
+    Shared by every search endpoint so the filtering and paging logic
+    lives in a single place.
+
+    Args:
+        cursor: Open database cursor
+        table: Element table to search (functions, classes, ...)
+        alias: SQL alias for the element table
+        match_column: Column matched against the search term
+        term: Raw search term (wrapped in % wildcards)
+        project_id: Optional project filter
+        limit: Maximum number of rows
+        offset: Optional row offset
+        columns: Element columns to select (all columns if None)
+        filters: Extra (clause, param) pairs ANDed into the WHERE clause
+        order: Whether to order results by the matched column
+
+    Returns:
+        List of sqlite rows, each including the file path
+    """
+    if columns:
+        selected = ", ".join(f"{alias}.{col}" for col in columns)
+    else:
+        selected = f"{alias}.*"
+
+    query = f"""
+        SELECT {selected}, fi.filepath
+        FROM {table} {alias}
+        JOIN files fi ON {alias}.file_id = fi.id
+        WHERE {alias}.{match_column} LIKE ?
+    """
+    params: list = [f"%{term}%"]
+
+    if project_id:
+        query += " AND fi.project_id = ?"
+        params.append(project_id)
+
+    for clause, value in filters or []:
+        query += f" AND {clause}"
+        params.append(value)
+
+    if order:
+        query += f" ORDER BY {alias}.{match_column}"
+
+    query += " LIMIT ?"
+    params.append(limit)
+
+    if offset is not None:
+        query += " OFFSET ?"
+        params.append(offset)
+
+    cursor.execute(query, params)
+    return cursor.fetchall()
+
+
+def _function_result(row) -> dict:
+    """Build a function search result from a database row."""
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "filepath": row["filepath"],
+        "lineno": row["lineno"],
+        "args": json.loads(row["args"]) if row["args"] else [],
+        "returns": row["returns"],
+        "is_async": bool(row["is_async"]),
+        "docstring": row["docstring"],
+    }
+
+
+def _class_result(row) -> dict:
+    """Build a class search result from a database row."""
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "filepath": row["filepath"],
+        "lineno": row["lineno"],
+        "bases": json.loads(row["bases"]) if row["bases"] else [],
+        "methods": json.loads(row["methods"]) if row["methods"] else [],
+        "docstring": row["docstring"],
+    }
+
+
+def _import_result(row) -> dict:
+    """Build an import search result from a database row."""
+    return {
+        "id": row["id"],
+        "module": row["module"],
+        "filepath": row["filepath"],
+        "lineno": row["lineno"],
+        "names": json.loads(row["names"]) if row["names"] else [],
+        "is_from_import": bool(row["is_from_import"]),
+    }
+
+
+def _variable_result(row) -> dict:
+    """Build a variable search result from a database row."""
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "filepath": row["filepath"],
+        "lineno": row["lineno"],
+        "type_annotation": row["type_annotation"],
+        "scope": row["scope"],
+    }
+
+
 @router.get("/functions")
 async def search_functions(
     q: str = Query(..., min_length=1, description="Search query"),
@@ -67,43 +188,11 @@ async def search_functions(
     db = get_db()
 
     with db._get_connection() as conn:
-        cursor = conn.cursor()
-
-        if project_id:
-            cursor.execute("""
-                SELECT f.*, fi.filepath
-                FROM functions f
-                JOIN files fi ON f.file_id = fi.id
-                WHERE f.name LIKE ? AND fi.project_id = ?
-                ORDER BY f.name
-                LIMIT ? OFFSET ?
-            """, (f"%{q}%", project_id, limit, offset))
-        else:
-            cursor.execute("""
-                SELECT f.*, fi.filepath
-                FROM functions f
-                JOIN files fi ON f.file_id = fi.id
-                WHERE f.name LIKE ?
-                ORDER BY f.name
-                LIMIT ? OFFSET ?
-            """, (f"%{q}%", limit, offset))
-
-        rows = cursor.fetchall()
-
-    results = []
-    for row in rows:
-        args = json.loads(row["args"]) if row["args"] else []
-        results.append({
-            "id": row["id"],
-            "name": row["name"],
-            "filepath": row["filepath"],
-            "lineno": row["lineno"],
-            "args": args,
-            "returns": row["returns"],
-            "is_async": bool(row["is_async"]),
-            "docstring": row["docstring"],
-        })
+        rows = _run_search(
+            conn.cursor(), "functions", "f", "name", q, project_id, limit, offset
+        )
 
+    results = [_function_result(row) for row in rows]
     return {"query": q, "count": len(results), "results": results}
 
 
@@ -118,43 +207,11 @@ async def search_classes(
     db = get_db()
 
     with db._get_connection() as conn:
-        cursor = conn.cursor()
-
-        if project_id:
-            cursor.execute("""
-                SELECT c.*, fi.filepath
-                FROM classes c
-                JOIN files fi ON c.file_id = fi.id
-                WHERE c.name LIKE ? AND fi.project_id = ?
-                ORDER BY c.name
-                LIMIT ? OFFSET ?
-            """, (f"%{q}%", project_id, limit, offset))
-        else:
-            cursor.execute("""
-                SELECT c.*, fi.filepath
-                FROM classes c
-                JOIN files fi ON c.file_id = fi.id
-                WHERE c.name LIKE ?
-                ORDER BY c.name
-                LIMIT ? OFFSET ?
-            """, (f"%{q}%", limit, offset))
-
-        rows = cursor.fetchall()
-
-    results = []
-    for row in rows:
-        bases = json.loads(row["bases"]) if row["bases"] else []
-        methods = json.loads(row["methods"]) if row["methods"] else []
-        results.append({
-            "id": row["id"],
-            "name": row["name"],
-            "filepath": row["filepath"],
-            "lineno": row["lineno"],
-            "bases": bases,
-            "methods": methods,
-            "docstring": row["docstring"],
-        })
+        rows = _run_search(
+            conn.cursor(), "classes", "c", "name", q, project_id, limit, offset
+        )
 
+    results = [_class_result(row) for row in rows]
     return {"query": q, "count": len(results), "results": results}
 
 
@@ -168,41 +225,9 @@ async def search_imports(
     db = get_db()
 
     with db._get_connection() as conn:
-        cursor = conn.cursor()
-
-        if project_id:
-            cursor.execute("""
-                SELECT i.*, fi.filepath
-                FROM imports i
-                JOIN files fi ON i.file_id = fi.id
-                WHERE i.module LIKE ? AND fi.project_id = ?
-                ORDER BY i.module
-                LIMIT ?
-            """, (f"%{module}%", project_id, limit))
-        else:
-            cursor.execute("""
-                SELECT i.*, fi.filepath
-                FROM imports i
-                JOIN files fi ON i.file_id = fi.id
-                WHERE i.module LIKE ?
-                ORDER BY i.module
-                LIMIT ?
-            """, (f"%{module}%", limit))
-
-        rows = cursor.fetchall()
-
-    results = []
-    for row in rows:
-        names = json.loads(row["names"]) if row["names"] else []
-        results.append({
-            "id": row["id"],
-            "module": row["module"],
-            "filepath": row["filepath"],
-            "lineno": row["lineno"],
-            "names": names,
-            "is_from_import": bool(row["is_from_import"]),
-        })
+        rows = _run_search(conn.cursor(), "imports", "i", "module", module, project_id, limit)
 
+    results = [_import_result(row) for row in rows]
     return {"module": module, "count": len(results), "results": results}
 
 
@@ -215,43 +240,15 @@ async def search_variables(
 ):
     """Search variables by name."""
     db = get_db()
+    filters = [("v.scope LIKE ?", f"%{scope}%")] if scope else None
 
     with db._get_connection() as conn:
-        cursor = conn.cursor()
-
-        query = """
-            SELECT v.*, fi.filepath
-            FROM variables v
-            JOIN files fi ON v.file_id = fi.id
-            WHERE v.name LIKE ?
-        """
-        params = [f"%{q}%"]
-
-        if project_id:
-            query += " AND fi.project_id = ?"
-            params.append(project_id)
-
-        if scope:
-            query += " AND v.scope LIKE ?"
-            params.append(f"%{scope}%")
-
-        query += " ORDER BY v.name LIMIT ?"
-        params.append(limit)
-
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-
-    results = []
-    for row in rows:
-        results.append({
-            "id": row["id"],
-            "name": row["name"],
-            "filepath": row["filepath"],
-            "lineno": row["lineno"],
-            "type_annotation": row["type_annotation"],
-            "scope": row["scope"],
-        })
+        rows = _run_search(
+            conn.cursor(), "variables", "v", "name", q, project_id, limit,
+            filters=filters,
+        )
 
+    results = [_variable_result(row) for row in rows]
     return {"query": q, "count": len(results), "results": results}
 
 
@@ -275,73 +272,26 @@ async def search_all(
     with db._get_connection() as conn:
         cursor = conn.cursor()
 
-        # Search functions
-        if project_id:
-            cursor.execute("""
-                SELECT f.name, fi.filepath, f.lineno
-                FROM functions f
-                JOIN files fi ON f.file_id = fi.id
-                WHERE f.name LIKE ? AND fi.project_id = ?
-                LIMIT ?
-            """, (f"%{q}%", project_id, limit))
-        else:
-            cursor.execute("""
-                SELECT f.name, fi.filepath, f.lineno
-                FROM functions f
-                JOIN files fi ON f.file_id = fi.id
-                WHERE f.name LIKE ?
-                LIMIT ?
-            """, (f"%{q}%", limit))
-
-        results["functions"] = [
-            {"name": r["name"], "filepath": r["filepath"], "lineno": r["lineno"]}
-            for r in cursor.fetchall()
-        ]
-
-        # Search classes
-        if project_id:
-            cursor.execute("""
-                SELECT c.name, fi.filepath, c.lineno
-                FROM classes c
-                JOIN files fi ON c.file_id = fi.id
-                WHERE c.name LIKE ? AND fi.project_id = ?
-                LIMIT ?
-            """, (f"%{q}%", project_id, limit))
-        else:
-            cursor.execute("""
-                SELECT c.name, fi.filepath, c.lineno
-                FROM classes c
-                JOIN files fi ON c.file_id = fi.id
-                WHERE c.name LIKE ?
-                LIMIT ?
-            """, (f"%{q}%", limit))
-
-        results["classes"] = [
-            {"name": r["name"], "filepath": r["filepath"], "lineno": r["lineno"]}
-            for r in cursor.fetchall()
-        ]
-
-        # Search variables
-        if project_id:
-            cursor.execute("""
-                SELECT v.name, fi.filepath, v.lineno, v.scope
-                FROM variables v
-                JOIN files fi ON v.file_id = fi.id
-                WHERE v.name LIKE ? AND fi.project_id = ?
-                LIMIT ?
-            """, (f"%{q}%", project_id, limit))
-        else:
-            cursor.execute("""
-                SELECT v.name, fi.filepath, v.lineno, v.scope
-                FROM variables v
-                JOIN files fi ON v.file_id = fi.id
-                WHERE v.name LIKE ?
-                LIMIT ?
-            """, (f"%{q}%", limit))
-
+        for key, table, alias in (
+            ("functions", "functions", "f"),
+            ("classes", "classes", "c"),
+        ):
+            rows = _run_search(
+                cursor, table, alias, "name", q, project_id, limit,
+                columns=["name", "lineno"], order=False,
+            )
+            results[key] = [
+                {"name": r["name"], "filepath": r["filepath"], "lineno": r["lineno"]}
+                for r in rows
+            ]
+
+        rows = _run_search(
+            cursor, "variables", "v", "name", q, project_id, limit,
+            columns=["name", "lineno", "scope"], order=False,
+        )
         results["variables"] = [
             {"name": r["name"], "filepath": r["filepath"], "lineno": r["lineno"], "scope": r["scope"]}
-            for r in cursor.fetchall()
+            for r in rows
         ]
 
     results["total"] = (
@@ -5,6 +5,7 @@ SQLite database for storing analysis results.
 
 import sqlite3
 import json
+import uuid
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
@@ -22,15 +23,36 @@ from ..parsers import (
 class DBManager:
     """SQLite database manager for analysis results."""
 
-    def __init__(self, db_path: str = "hypermatrix.db"):
+    def __init__(self, db_path: str = "hypermatrix.db", fast: bool = False):
+        """
+        Args:
+            db_path: SQLite file path, or ":memory:" for a private in-memory DB
+            fast: Skip journaling durability (for tests and throwaway DBs)
+        """
         self.db_path = db_path
+        self._fast = fast
+        self._connect_target = db_path
+        self._uri = False
+        self._keepalive = None
+
+        if db_path == ":memory:":
+            # Every connection to ":memory:" is a new empty database, so use a
+            # named shared-cache one and hold a connection open to keep it alive.
+            self._connect_target = f"file:hypermatrix_{uuid.uuid4().hex}?mode=memory&cache=shared"
+            self._uri = True
+            self._keepalive = sqlite3.connect(self._connect_target, uri=True)
+
         self._init_database()
 
     @contextmanager
     def _get_connection(self):
         """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self._connect_target, uri=self._uri)
         conn.row_factory = sqlite3.Row
+        if self._fast:
+            conn.execute("PRAGMA journal_mode=MEMORY")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("PRAGMA temp_store=MEMORY")
         try:
             yield conn
             conn.commit()
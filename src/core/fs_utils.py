@@ -0,0 +1,40 @@
+"""
+HyperMatrix v2026 - Filesystem Utilities
+Directory walking shared by the web routes.
+"""
+
+import os
+
+
+def iter_files(root):
+    """
+    Recursively yield os.DirEntry objects for all regular files under root.
+
+    Uses os.scandir so file type checks and stat results come from the
+    directory listing instead of a fresh syscall per path.
+    """
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from iter_files(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+
+def scan_folder(path) -> tuple:
+    """Return (total size in bytes, file count) for a folder."""
+    total = 0
+    count = 0
+    for entry in iter_files(path):
+        try:
+            total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+        count += 1
+    return total, count
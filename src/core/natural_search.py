@@ -4,6 +4,7 @@ Search code using natural language queries.
 """
 
 import re
+import heapq
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -458,11 +459,11 @@ class NaturalSearch:
                 if filename in entry['filepath']
             ]
 
-        # Sort by score
-        scored_entries.sort(key=lambda x: x[0], reverse=True)
+        # Keep only the best `limit` by score (same order as a full sort)
+        top_entries = heapq.nlargest(limit, scored_entries, key=lambda x: x[0])
 
         # Convert to SearchResult
-        for score, entry, matched in scored_entries[:limit]:
+        for score, entry, matched in top_entries:
             results.append(SearchResult(
                 filepath=entry['filepath'],
                 element_name=entry['name'],
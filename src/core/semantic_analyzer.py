@@ -6,6 +6,7 @@ Analyzes semantic similarity between code using embeddings and AST analysis.
 import ast
 import hashlib
 import logging
+import math
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -25,6 +26,25 @@ except ImportError:
     logger.info("NumPy not available - using fallback similarity")
 
 
+def _cosine_similarity(v1: List[float], v2: List[float]) -> Optional[float]:
+    """
+    Cosine similarity of two feature vectors, normalized to 0-1.
+
+    Feature vectors are short (~10 entries), so a single pure-Python pass
+    is cheaper than building arrays for every compared pair.
+    Returns None if either vector has zero norm.
+    """
+    dot = norm1 = norm2 = 0.0
+    for a, b in zip(v1, v2):
+        dot += a * b
+        norm1 += a * a
+        norm2 += b * b
+    norm = math.sqrt(norm1) * math.sqrt(norm2)
+    if norm > 0:
+        return (dot / norm + 1) / 2
+    return None
+
+
 @dataclass
 class SemanticSignature:
     """Semantic signature of a code element."""
@@ -457,13 +477,9 @@ class SemanticAnalyzer:
 
         # Feature vector similarity (if available)
         if sig1.feature_vector and sig2.feature_vector and NUMPY_AVAILABLE:
-            v1 = np.array(sig1.feature_vector)
-            v2 = np.array(sig2.feature_vector)
-            # Cosine similarity
-            dot = np.dot(v1, v2)
-            norm = np.linalg.norm(v1) * np.linalg.norm(v2)
-            if norm > 0:
-                scores.append((dot / norm + 1) / 2)  # Normalize to 0-1
+            cosine = _cosine_similarity(sig1.feature_vector, sig2.feature_vector)
+            if cosine is not None:
+                scores.append(cosine)
 
         return sum(scores) / len(scores) if scores else 0.5
 
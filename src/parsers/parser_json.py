@@ -5,9 +5,30 @@ Extracts structure, keys, values and validates JSON documents.
 
 import json
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Optional, Union
 from enum import Enum
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(source: Union[str, bytes]) -> Any:
+    """
+    Decode JSON, using orjson when available.
+
+    Falls back to the stdlib for documents orjson rejects but json accepts
+    (integers beyond 64 bits, NaN/Infinity) and for its error messages.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(source)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(source)
+
 
 class JSONValueType(Enum):
     """Type of JSON value."""
@@ -90,27 +111,30 @@ class JSONParser:
         self.result = JSONParseResult()
         self._max_depth = 0
 
-    def parse(self, source: str) -> JSONParseResult:
-        """Parse JSON source and extract structure."""
+    def parse(self, source: Union[str, bytes]) -> JSONParseResult:
+        """Parse JSON source (str or UTF-8 bytes) and extract structure."""
         self.result = JSONParseResult()
         self._max_depth = 0
 
         try:
-            data = json.loads(source)
-            self.result.is_valid = True
-            self.result.root_type = self._get_value_type(data)
-            self._traverse(data, "$", 0)
-            self.result.max_depth = self._max_depth
-            self.result.total_keys = len(self.result.keys)
-        except json.JSONDecodeError as e:
+            data = _loads(source)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             self.result.is_valid = False
             self.result.error_message = str(e)
+            return self.result
+
+        self.result.is_valid = True
+        self.result.root_type = self._get_value_type(data)
+        self._traverse(data, "$", 0, self.result.root_type)
+        self.result.max_depth = self._max_depth
+        self.result.total_keys = len(self.result.keys)
 
         return self.result
 
     def parse_file(self, filepath: str) -> JSONParseResult:
         """Parse a JSON file and extract structure."""
-        with open(filepath, "r", encoding="utf-8") as f:
+        # Bytes go straight to the decoder, skipping a separate UTF-8 decode
+        with open(filepath, "rb") as f:
             source = f.read()
         return self.parse(source)
 
@@ -130,10 +154,17 @@ class JSONParser:
             return JSONValueType.OBJECT
         return JSONValueType.STRING
 
-    def _traverse(self, data: Any, path: str, depth: int):
-        """Recursively traverse JSON structure."""
+    def _traverse(self, data: Any, path: str, depth: int,
+                  value_type: Optional[JSONValueType] = None):
+        """
+        Recursively traverse JSON structure.
+
+        Callers that already classified data pass value_type so each value
+        is typed once per parse.
+        """
         self._max_depth = max(self._max_depth, depth)
-        value_type = self._get_value_type(data)
+        if value_type is None:
+            value_type = self._get_value_type(data)
 
         # Record data flow READ
         self.result.data_flow.append(JSONDataFlowInfo(
@@ -149,9 +180,9 @@ class JSONParser:
             nullable=data is None,
         ))
 
-        if isinstance(data, dict):
+        if value_type is JSONValueType.OBJECT:
             self._process_object(data, path, depth)
-        elif isinstance(data, list):
+        elif value_type is JSONValueType.ARRAY:
             self._process_array(data, path, depth)
 
     def _process_object(self, data: dict, path: str, depth: int):
@@ -184,7 +215,7 @@ class JSONParser:
                 value_type=value_type,
             ))
 
-            self._traverse(value, key_path, depth + 1)
+            self._traverse(value, key_path, depth + 1, value_type)
 
     def _process_array(self, data: list, path: str, depth: int):
         """Process a JSON array."""
@@ -199,16 +230,16 @@ class JSONParser:
         )
         self.result.arrays.append(array_info)
 
-        for i, item in enumerate(data):
+        for i, (item, item_type) in enumerate(zip(data, item_types)):
             item_path = f"{path}[{i}]"
-            self._traverse(item, item_path, depth + 1)
+            self._traverse(item, item_path, depth + 1, item_type)
 
-    def validate(self, source: str) -> tuple[bool, Optional[str]]:
+    def validate(self, source: Union[str, bytes]) -> tuple[bool, Optional[str]]:
         """Validate JSON and return (is_valid, error_message)."""
         try:
-            json.loads(source)
+            _loads(source)
             return True, None
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             return False, str(e)
 
     def get_paths(self, source: str) -> list[str]:
@@ -221,7 +252,7 @@ class JSONParser:
 
     def get_value_at_path(self, source: str, path: str) -> Any:
         """Get value at a specific JSON path."""
-        data = json.loads(source)
+        data = _loads(source)
 
         if path == "$":
             return data
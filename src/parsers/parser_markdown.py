@@ -4,9 +4,11 @@ Extracts headings, links, code blocks, lists and document structure.
 """
 
 import re
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from typing import Optional
 from enum import Enum
+from itertools import accumulate
 
 
 class MDElementType(Enum):
@@ -102,18 +104,26 @@ class MarkdownParser:
     BLOCKQUOTE_PATTERN = re.compile(r'^(>+)\s*(.*)$', re.MULTILINE)
     TABLE_ROW_PATTERN = re.compile(r'^\|(.+)\|$', re.MULTILINE)
     HORIZONTAL_RULE_PATTERN = re.compile(r'^(?:---|\*\*\*|___)\s*$', re.MULTILINE)
+    TABLE_SEPARATOR_PATTERN = re.compile(r'^\|[\s\-:|]+\|$')
+    MARKDOWN_SYNTAX_PATTERN = re.compile(r'[#*_\[\]()>`]')
 
     def __init__(self):
         self.result = MDParseResult()
+        self._line_starts: list[int] = [0]
+        self._fence_starts: list[int] = []
+        self._fence_ends: list[int] = []
 
     def parse(self, source: str) -> MDParseResult:
         """Parse Markdown source and extract elements."""
         self.result = MDParseResult()
         lines = source.split('\n')
         self.result.line_count = len(lines)
+        # Offset where each line starts, for bisect-based line numbers
+        self._line_starts = [0, *accumulate(len(line) + 1 for line in lines[:-1])]
 
-        self._extract_headings(source)
+        # Code blocks first: their spans mask everything else
         self._extract_code_blocks(source)
+        self._extract_headings(source)
         self._extract_links(source)
         self._extract_images(source)
         self._extract_lists(source)
@@ -129,13 +139,20 @@ class MarkdownParser:
             source = f.read()
         return self.parse(source)
 
+    def _in_code_block(self, pos: int) -> bool:
+        """Check whether a source offset falls inside a fenced code block."""
+        i = bisect_right(self._fence_starts, pos) - 1
+        return i >= 0 and pos < self._fence_ends[i]
+
     def _get_lineno(self, source: str, match_start: int) -> int:
-        """Get line number from match position."""
-        return source[:match_start].count('\n') + 1
+        """Get line number from match position (source must be the one being parsed)."""
+        return bisect_right(self._line_starts, match_start)
 
     def _extract_headings(self, source: str):
         """Extract heading elements."""
         for match in self.HEADING_PATTERN.finditer(source):
+            if self._in_code_block(match.start()):
+                continue
             level = len(match.group(1))
             text = match.group(2).strip()
 
@@ -147,8 +164,12 @@ class MarkdownParser:
             self.result.headings.append(heading_info)
 
     def _extract_code_blocks(self, source: str):
-        """Extract fenced code blocks."""
+        """Extract fenced code blocks and record their spans."""
+        self._fence_starts = []
+        self._fence_ends = []
         for match in self.CODE_BLOCK_PATTERN.finditer(source):
+            self._fence_starts.append(match.start())
+            self._fence_ends.append(match.end())
             language = match.group(1) or None
             content = match.group(2)
             lineno = self._get_lineno(source, match.start())
@@ -164,10 +185,13 @@ class MarkdownParser:
 
     def _extract_links(self, source: str):
         """Extract links (excluding images)."""
-        # Remove images first to avoid capturing them
-        source_no_images = self.IMAGE_PATTERN.sub('', source)
-
-        for match in self.LINK_PATTERN.finditer(source_no_images):
+        for match in self.LINK_PATTERN.finditer(source):
+            start = match.start()
+            # Images are handled by _extract_images: skip "![...](...)" itself
+            # and the "[![...](...)" prefix of a badge link wrapping one
+            if ((start and source[start - 1] == '!') or match.group(1).startswith('![')
+                    or self._in_code_block(start)):
+                continue
             text = match.group(1)
             url = match.group(2)
             title = match.group(3)
@@ -183,6 +207,8 @@ class MarkdownParser:
     def _extract_images(self, source: str):
         """Extract image references."""
         for match in self.IMAGE_PATTERN.finditer(source):
+            if self._in_code_block(match.start()):
+                continue
             alt_text = match.group(1)
             url = match.group(2)
             title = match.group(3)
@@ -200,6 +226,8 @@ class MarkdownParser:
         """Extract list items."""
         # Unordered lists
         for match in self.UNORDERED_LIST_PATTERN.finditer(source):
+            if self._in_code_block(match.start()):
+                continue
             indent = len(match.group(1))
             level = indent // 2 + 1
             text = match.group(2)
@@ -214,6 +242,8 @@ class MarkdownParser:
 
         # Ordered lists
         for match in self.ORDERED_LIST_PATTERN.finditer(source):
+            if self._in_code_block(match.start()):
+                continue
             indent = len(match.group(1))
             level = indent // 2 + 1
             order_num = int(match.group(2))
@@ -231,6 +261,8 @@ class MarkdownParser:
     def _extract_blockquotes(self, source: str):
         """Extract blockquotes."""
         for match in self.BLOCKQUOTE_PATTERN.finditer(source):
+            if self._in_code_block(match.start()):
+                continue
             level = len(match.group(1))
             text = match.group(2).strip()
 
@@ -247,10 +279,11 @@ class MarkdownParser:
         i = 0
         while i < len(lines):
             line = lines[i]
-            if '|' in line and i + 1 < len(lines):
+            if ('|' in line and i + 1 < len(lines)
+                    and not self._in_code_block(self._line_starts[i])):
                 # Check if next line is separator
                 next_line = lines[i + 1]
-                if re.match(r'^\|[\s\-:|]+\|$', next_line):
+                if self.TABLE_SEPARATOR_PATTERN.match(next_line):
                     # Found table header
                     headers = [cell.strip() for cell in line.strip('|').split('|')]
 
@@ -258,7 +291,7 @@ class MarkdownParser:
                     rows = []
                     j = i + 2
                     while j < len(lines) and '|' in lines[j]:
-                        if not re.match(r'^\|[\s\-:|]+\|$', lines[j]):
+                        if not self.TABLE_SEPARATOR_PATTERN.match(lines[j]):
                             row = [cell.strip() for cell in lines[j].strip('|').split('|')]
                             rows.append(row)
                         j += 1
@@ -280,7 +313,7 @@ class MarkdownParser:
         text = self.INLINE_CODE_PATTERN.sub('', text)
 
         # Remove markdown syntax
-        text = re.sub(r'[#*_\[\]()>`]', ' ', text)
+        text = self.MARKDOWN_SYNTAX_PATTERN.sub(' ', text)
 
         # Count words
         words = text.split()
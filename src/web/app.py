@@ -21,6 +21,7 @@ from .models import (
 from ..core.db_manager import DBManager
 from ..core.consolidation import ConsolidationEngine, SiblingGroup
 from ..core.fusion import IntelligentFusion
+from ..core.ml_learning import get_learning_system
 from ..phases.phase1_discovery import Phase1Discovery
 from ..phases.phase1_5_deduplication import Phase1_5Deduplication
 from ..phases.phase2_analysis import Phase2Analysis
@@ -86,6 +87,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"[HyperMatrix] Warning: Could not load projects from DB: {e}")
 
+    # Warm the shared learning system so the first ML request doesn't pay
+    # for loading its decision history from disk
+    try:
+        get_learning_system()
+    except Exception as e:
+        print(f"[HyperMatrix] Warning: Could not load learning data: {e}")
+
     yield
     # Cleanup
     print("[HyperMatrix] Shutting down...")
@@ -3,6 +3,7 @@ HyperMatrix v2026 - Analysis Routes
 Endpoints for dependency analysis, quality metrics, and version tracking.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -18,17 +19,15 @@ router = APIRouter()
 
 
 # Initialize analyzers lazily
-_impact_analyzer: Optional[ImpactAnalyzer] = None
 _quality_analyzer: Optional[QualityAnalyzer] = None
-_version_tracker: Optional[VersionTracker] = None
-_merge_validator: Optional[MergeValidator] = None
+
+# VersionTracker and MergeValidator are cached by project root
+PROJECT_CACHE_SIZE = 8
 
 
 def get_impact_analyzer(project_root: str) -> ImpactAnalyzer:
-    global _impact_analyzer
-    if _impact_analyzer is None or str(_impact_analyzer.project_root) != project_root:
-        _impact_analyzer = ImpactAnalyzer(project_root)
-    return _impact_analyzer
+    """Build a fresh analyzer; it never rebuilds its dependency graph, so it is not cached."""
+    return ImpactAnalyzer(project_root)
 
 
 def get_quality_analyzer() -> QualityAnalyzer:
@@ -38,18 +37,14 @@ def get_quality_analyzer() -> QualityAnalyzer:
     return _quality_analyzer
 
 
+@lru_cache(maxsize=PROJECT_CACHE_SIZE)
 def get_version_tracker(project_root: str) -> VersionTracker:
-    global _version_tracker
-    if _version_tracker is None or str(_version_tracker.project_root) != project_root:
-        _version_tracker = VersionTracker(project_root)
-    return _version_tracker
+    return VersionTracker(project_root)
 
 
+@lru_cache(maxsize=PROJECT_CACHE_SIZE)
 def get_merge_validator(project_root: str) -> MergeValidator:
-    global _merge_validator
-    if _merge_validator is None or str(_merge_validator.project_root) != project_root:
-        _merge_validator = MergeValidator(project_root)
-    return _merge_validator
+    return MergeValidator(project_root)
 
 
 # ============ DEPENDENCY ANALYSIS (B.5) ============
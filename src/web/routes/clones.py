@@ -9,6 +9,7 @@ from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query
 
 from ...core.clone_detector import CloneDetector
+from ...core.fs_utils import iter_files
 from ...core.semantic_analyzer import SemanticAnalyzer
 from ..app import scan_results
 
@@ -181,7 +182,8 @@ async def find_clones_of_file(
     # If no search paths provided, use parent directory
     if not search_in:
         parent = Path(filepath).parent
-        search_in = [str(f) for f in parent.rglob("*.py") if str(f) != filepath]
+        search_in = [entry.path for entry in iter_files(parent)
+                     if entry.name.endswith(".py") and entry.path != filepath]
 
     valid_search = [f for f in search_in if Path(f).exists() and f != filepath]
 
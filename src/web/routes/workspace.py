@@ -1,14 +1,17 @@
 """HyperMatrix v2026 - Workspace Management API"""
 
+import asyncio
 import os
 import shutil
 from pathlib import Path
 from typing import Optional
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Query
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Query, Request
 from fastapi.responses import JSONResponse
 import zipfile
 import tempfile
 
+from ...core.fs_utils import scan_folder
+
 router = APIRouter(prefix="/api/workspace", tags=["workspace"])
 
 WORKSPACE_PATH = Path("/workspace")
@@ -17,27 +20,32 @@ MAX_WORKSPACE_SIZE = 20 * 1024 * 1024 * 1024  # 20GB limit
 
 def get_workspace_size() -> int:
     """Calculate total size of workspace in bytes."""
-    total = 0
     if WORKSPACE_PATH.exists():
-        for entry in WORKSPACE_PATH.rglob("*"):
-            if entry.is_file():
-                try:
-                    total += entry.stat().st_size
-                except:
-                    pass
-    return total
+        return get_folder_size(WORKSPACE_PATH)
+    return 0
 
 
 def get_folder_size(path: Path) -> int:
     """Calculate size of a folder in bytes."""
-    total = 0
-    for entry in path.rglob("*"):
-        if entry.is_file():
-            try:
-                total += entry.stat().st_size
-            except:
-                pass
-    return total
+    return scan_folder(path)[0]
+
+
+def check_content_length(request: Request, current_size: int):
+    """
+    Cheap pre-check of an upload against the workspace limit.
+
+    FastAPI has already received and spooled the multipart body by the time
+    a handler runs; this only avoids copying it into the workspace. The
+    Content-Length header covers the whole body, so it is an upper bound on
+    the file size; uploads without the header are checked after reading.
+    """
+    try:
+        content_length = int(request.headers.get("content-length", 0))
+    except ValueError:
+        return
+    if content_length and current_size + content_length > MAX_WORKSPACE_SIZE:
+        raise HTTPException(status_code=507,
+            detail=f"Upload would exceed 20GB limit. Available: {(MAX_WORKSPACE_SIZE - current_size) / 1024 / 1024:.0f} MB")
 
 
 @router.get("")
@@ -46,19 +54,23 @@ async def workspace_status():
     WORKSPACE_PATH.mkdir(parents=True, exist_ok=True)
 
     items = []
-    for entry in WORKSPACE_PATH.iterdir():
+    used = 0
+    with os.scandir(WORKSPACE_PATH) as it:
+        entries = list(it)
+    for entry in entries:
         try:
-            if entry.is_dir():
-                size = get_folder_size(entry)
-                file_count = sum(1 for _ in entry.rglob("*") if _.is_file())
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if is_dir:
+                size, file_count = scan_folder(entry.path)
             else:
-                size = entry.stat().st_size
+                size = entry.stat(follow_symlinks=False).st_size
                 file_count = 1
+            used += size
 
             items.append({
                 "name": entry.name,
-                "path": str(entry),
-                "is_dir": entry.is_dir(),
+                "path": entry.path,
+                "is_dir": is_dir,
                 "size": size,
                 "size_human": f"{size / 1024 / 1024:.1f} MB",
                 "file_count": file_count
@@ -66,8 +78,6 @@ async def workspace_status():
         except Exception as e:
             continue
 
-    used = get_workspace_size()
-
     return {
         "path": str(WORKSPACE_PATH),
         "items": items,
@@ -82,6 +92,7 @@ async def workspace_status():
 
 @router.post("/upload")
 async def upload_to_workspace(
+    request: Request,
     file: UploadFile = File(...),
     extract: bool = Form(True),
     folder_name: Optional[str] = Form(None)
@@ -96,6 +107,7 @@ async def upload_to_workspace(
     current_size = get_workspace_size()
     if current_size >= MAX_WORKSPACE_SIZE:
         raise HTTPException(status_code=507, detail="Workspace full (20GB limit)")
+    check_content_length(request, current_size)
 
     filename = file.filename or "uploaded"
 
@@ -195,10 +207,13 @@ async def copy_from_projects(
         counter += 1
 
     try:
+        # Copy off the event loop so large trees don't block other requests
         if source_path.is_dir():
-            shutil.copytree(source_path, target_path)
+            await asyncio.to_thread(
+                shutil.copytree, source_path, target_path, ignore_dangling_symlinks=True
+            )
         else:
-            shutil.copy2(source_path, target_path)
+            await asyncio.to_thread(shutil.copy2, source_path, target_path)
 
         return {
             "success": True,
@@ -228,9 +243,9 @@ async def delete_from_workspace(item_name: str):
 
     try:
         if target.is_dir():
-            shutil.rmtree(target)
+            await asyncio.to_thread(shutil.rmtree, target)
         else:
-            target.unlink()
+            await asyncio.to_thread(target.unlink)
 
         return {"success": True, "deleted": item_name}
     except Exception as e:
@@ -244,9 +259,9 @@ async def clear_workspace():
         if WORKSPACE_PATH.exists():
             for item in WORKSPACE_PATH.iterdir():
                 if item.is_dir():
-                    shutil.rmtree(item)
+                    await asyncio.to_thread(shutil.rmtree, item)
                 else:
-                    item.unlink()
+                    await asyncio.to_thread(item.unlink)
 
         return {"success": True, "message": "Workspace cleared"}
     except Exception as e:
@@ -282,6 +297,7 @@ async def create_folder(name: str = Form(...)):
 
 @router.post("/upload-file")
 async def upload_single_file(
+    request: Request,
     file: UploadFile = File(...),
     path: str = Form(..., description="Relative path including folder name")
 ):
@@ -292,6 +308,7 @@ async def upload_single_file(
     current_size = get_workspace_size()
     if current_size >= MAX_WORKSPACE_SIZE:
         raise HTTPException(status_code=507, detail="Workspace full (20GB limit)")
+    check_content_length(request, current_size)
 
     # Build target path - path includes folder name like "myproject/src/file.py"
     safe_path = path.replace("\\", "/").lstrip("/")
@@ -4,22 +4,9 @@ Shared fixtures for all tests.
 """
 
 import pytest
-import tempfile
-import os
-from pathlib import Path
-
-
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
 
 
-@pytest.fixture
-def sample_python_code():
-    """Sample Python code for testing."""
-    return '''
+SAMPLE_PYTHON_CODE = '''
 """Module docstring."""
 
 import os
@@ -89,10 +76,7 @@ result = simple_function(x, y)
 '''
 
 
-@pytest.fixture
-def sample_javascript_code():
-    """Sample JavaScript code for testing."""
-    return '''
+SAMPLE_JAVASCRIPT_CODE = '''
 import React from 'react';
 import { useState, useEffect } from 'react';
 import * as utils from './utils';
@@ -136,10 +120,7 @@ export { calculateTotal, processData };
 '''
 
 
-@pytest.fixture
-def sample_markdown_code():
-    """Sample Markdown content for testing."""
-    return '''
+SAMPLE_MARKDOWN_CODE = '''
 # Main Title
 
 This is an introduction paragraph.
@@ -192,10 +173,7 @@ The end.
 '''
 
 
-@pytest.fixture
-def sample_json_code():
-    """Sample JSON content for testing."""
-    return '''
+SAMPLE_JSON_CODE = '''
 {
     "name": "HyperMatrix",
     "version": "2026.1.0",
@@ -227,11 +205,40 @@ def sample_json_code():
 
 
 @pytest.fixture
-def create_temp_file(temp_dir):
+def temp_dir(tmp_path):
+    """Temporary directory for tests (pytest's tmp_path as a string)."""
+    return str(tmp_path)
+
+
+@pytest.fixture(scope="session")
+def sample_python_code():
+    """Sample Python code for testing."""
+    return SAMPLE_PYTHON_CODE
+
+
+@pytest.fixture(scope="session")
+def sample_javascript_code():
+    """Sample JavaScript code for testing."""
+    return SAMPLE_JAVASCRIPT_CODE
+
+
+@pytest.fixture(scope="session")
+def sample_markdown_code():
+    """Sample Markdown content for testing."""
+    return SAMPLE_MARKDOWN_CODE
+
+
+@pytest.fixture(scope="session")
+def sample_json_code():
+    """Sample JSON content for testing."""
+    return SAMPLE_JSON_CODE
+
+
+@pytest.fixture
+def create_temp_file(tmp_path):
     """Factory fixture to create temporary files."""
     def _create_file(filename: str, content: str) -> str:
-        filepath = os.path.join(temp_dir, filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return filepath
+        filepath = tmp_path / filename
+        filepath.write_text(content, encoding='utf-8')
+        return str(filepath)
     return _create_file
@@ -10,19 +10,71 @@ Uso:
     python tests/smoke_test.py [--url http://localhost:26020]
 """
 
+import os
 import sys
 import json
+import time
 import argparse
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
-from urllib.parse import urlencode
+import http.client
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+# orjson si está disponible (trabaja directamente con bytes)
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# Colores para output (sin códigos ANSI fuera de una terminal o con NO_COLOR)
+if sys.stdout.isatty() and not os.environ.get("NO_COLOR"):
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    YELLOW = '\033[93m'
+    RESET = '\033[0m'
+    BOLD = '\033[1m'
+else:
+    GREEN = RED = YELLOW = RESET = BOLD = ''
+
+# Líneas del informe con los colores ya compuestos
+OK_FMT = f"  {GREEN}[OK]{RESET} %s"
+FAIL_FMT = f"  {RED}[FAIL]{RESET} %s: %s"
+WARN_FMT = f"  {YELLOW}[WARN]{RESET} %s"
+
+# Reintentos para respuestas transitorias (500 no: es un fallo real)
+RETRY_STATUSES = (429, 502, 503, 504)
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.1
+MAX_RETRY_AFTER = 5.0
+
+# Respuestas GET que varios tests piden seguidas: se reutilizan unos segundos
+CACHEABLE_ENDPOINTS = frozenset({"/api/scan/list", "/api/ai/status"})
+CACHE_TTL = 10.0
+
+# Errores de transporte: un único camino de error en test()
+REQUEST_ERRORS = (OSError, http.client.HTTPException)
+
+# Sondeo de arranque corto; cada test conserva su timeout de 30 s
+READY_TIMEOUT = 2
+TEST_TIMEOUT = 30
+
+# Tests independientes en paralelo (una conexión por hilo)
+MAX_WORKERS = 8
+
+
+def _missing_keys(json_data, expect_keys: list):
+    """Motivo del fallo si faltan keys esperadas en el JSON, o None."""
+    if expect_keys and isinstance(json_data, dict):
+        missing = [k for k in expect_keys if k not in json_data]
+        if missing:
+            return f"Faltan keys: {missing}"
+    return None
 
-# Colores para output
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-RESET = '\033[0m'
-BOLD = '\033[1m'
 
 class SmokeTest:
     def __init__(self, base_url: str):
@@ -30,83 +82,229 @@ class SmokeTest:
         self.results = []
         self.failed = 0
         self.passed = 0
-
-    def test(self, name: str, endpoint: str, method: str = "GET",
-             data: dict = None, expect_keys: list = None,
-             expect_status: int = 200, timeout: int = 30):
-        """Ejecutar un test individual."""
-        url = f"{self.base_url}{endpoint}"
-
+        self._cache = {}
+        # Un lock por endpoint cacheable: hilos concurrentes esperan a la primera respuesta
+        self._cache_locks = {endpoint: threading.Lock() for endpoint in CACHEABLE_ENDPOINTS}
+        self._parsed_cache = {}
+
+        # Una conexión keep-alive por hilo, reutilizada entre sus tests
+        parts = urlsplit(self.base_url)
+        self._conn_class = (http.client.HTTPSConnection if parts.scheme == "https"
+                            else http.client.HTTPConnection)
+        self._host, self._port = parts.hostname, parts.port
+        self._prefix = parts.path
+        self._local = threading.local()
+        self._conns = []
+        self._conns_lock = threading.Lock()
+        self._executor = None
+
+    @property
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._conn_class(self._host, self._port)
+            with self._conns_lock:
+                self._conns.append(conn)
+        return conn
+
+    def request(self, endpoint: str, method: str = "GET", data: dict = None,
+                timeout: int = TEST_TIMEOUT, retries: int = MAX_RETRIES):
+        """
+        Petición HTTP con reintentos ante 429/502/503/504.
+        Espera con backoff exponencial, respetando Retry-After si viene.
+        Los GET de CACHEABLE_ENDPOINTS se sirven de caché durante CACHE_TTL.
+        """
+        if method == "GET" and endpoint in CACHEABLE_ENDPOINTS:
+            with self._cache_locks[endpoint]:
+                cached = self._cache.get(endpoint)
+                if cached and time.monotonic() - cached[0] < CACHE_TTL:
+                    return cached[1], cached[2]
+                status, body = self._request(endpoint, method, data, timeout, retries)
+                if status == 200:
+                    self._cache[endpoint] = (time.monotonic(), status, body)
+                return status, body
+        return self._request(endpoint, method, data, timeout, retries)
+
+    def _request(self, endpoint: str, method: str, data: dict, timeout: int,
+                 retries: int):
+        """Envío con reintentos, sin pasar por la caché."""
+        for attempt in range(retries + 1):
+            status, headers, body = self._send(endpoint, method, data, timeout)
+            if status not in RETRY_STATUSES or attempt == retries:
+                break
+            delay = BACKOFF_FACTOR * (2 ** attempt)
+            retry_after = headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                delay = min(float(retry_after), MAX_RETRY_AFTER)
+            time.sleep(delay)
+        return status, body
+
+    def is_ready(self) -> bool:
+        """Sondeo único a /health antes de lanzar la batería de tests."""
         try:
-            if data:
-                req = Request(url, data=json.dumps(data).encode('utf-8'),
-                            headers={'Content-Type': 'application/json'},
-                            method=method)
-            else:
-                req = Request(url, method=method)
-
-            response = urlopen(req, timeout=timeout)
-            status = response.getcode()
-            body = response.read().decode('utf-8')
+            status, _ = self.request("/health", timeout=READY_TIMEOUT, retries=0)
+        except REQUEST_ERRORS:
+            return False
+        return status == 200
 
+    def parse_json(self, endpoint: str, body: bytes):
+        """Decodificar JSON una sola vez por respuesta cacheada."""
+        cached = self._parsed_cache.get(endpoint)
+        if cached and cached[0] is body:
+            return cached[1]
+        try:
+            json_data = json_loads(body)
+        except ValueError:
+            json_data = None
+        if endpoint in CACHEABLE_ENDPOINTS:
+            self._parsed_cache[endpoint] = (body, json_data)
+        return json_data
+
+    def _send(self, endpoint: str, method: str, data: dict, timeout: int):
+        """Petición HTTP sobre la conexión compartida. Devuelve (status, headers, body)."""
+        body = json_dumps(data) if data else None
+        headers = {'Content-Type': 'application/json'} if data else {}
+        conn = self._conn
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+
+        for attempt in range(2):
             try:
-                json_data = json.loads(body)
-            except:
-                json_data = None
-
-            # Verificar status
-            if status != expect_status:
-                self._fail(name, f"Status {status}, esperado {expect_status}")
-                return False
-
-            # Verificar keys esperadas
-            if expect_keys and json_data:
-                missing = [k for k in expect_keys if k not in json_data]
-                if missing:
-                    self._fail(name, f"Faltan keys: {missing}")
-                    return False
-
-            self._pass(name)
-            return True
-
-        except HTTPError as e:
-            if e.code == expect_status:
-                self._pass(name)
-                return True
-            self._fail(name, f"HTTP {e.code}: {e.reason}")
-            return False
-        except URLError as e:
-            self._fail(name, f"Connection error: {e.reason}")
-            return False
-        except Exception as e:
-            self._fail(name, str(e))
+                conn.request(method, self._prefix + endpoint, body=body,
+                             headers=headers)
+                response = conn.getresponse()
+                content = response.read()
+                return response.status, response.headers, content
+            except REQUEST_ERRORS as e:
+                conn.close()
+                # El servidor cerró la conexión keep-alive: reconectar una vez
+                if attempt or not isinstance(e, ConnectionError):
+                    raise
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._conns_lock:
+            for conn in self._conns:
+                conn.close()
+
+    def _check(self, endpoint: str, method: str = "GET", data: dict = None,
+               expect_keys: list = None, expect_status: int = 200,
+               timeout: int = TEST_TIMEOUT, parse: bool = False):
+        """
+        Hacer la petición y validarla. Devuelve (json, motivo del fallo o None).
+        El JSON solo se decodifica si hay keys que verificar o parse=True.
+        """
+        # Sin reintentos cuando se prueba a propósito un error
+        retries = MAX_RETRIES if expect_status < 400 else 0
+        try:
+            status, body = self.request(endpoint, method, data, timeout, retries)
+        except REQUEST_ERRORS as e:
+            return None, f"Connection error: {e}"
+
+        # Verificar status
+        if status != expect_status:
+            return None, f"Status {status}, esperado {expect_status}"
+
+        json_data = self.parse_json(endpoint, body) if expect_keys or parse else None
+
+        reason = _missing_keys(json_data, expect_keys)
+        return (None, reason) if reason else (json_data, None)
+
+    def _check_many(self, names, endpoint: str, expect_keys_any: list = None,
+                    **kwargs) -> list:
+        """
+        Una sola petición validada contra varios conjuntos de keys.
+
+        Returns:
+            Tuplas (nombre, json, motivo), una por conjunto de keys
+        """
+        json_data, reason = self._check(endpoint, parse=True, **kwargs)
+        results = []
+        for name, keys in zip(names, expect_keys_any):
+            key_reason = reason or _missing_keys(json_data, keys)
+            results.append((name, None if key_reason else json_data, key_reason))
+        return results
+
+    def _record(self, name: str, json_data, reason: str) -> bool:
+        if reason:
+            self._fail(name, reason)
             return False
+        self._pass(name)
+        return True
+
+    def test(self, name: str, endpoint: str, **kwargs) -> bool:
+        """Ejecutar un test individual."""
+        return self._record(name, *self._check(endpoint, **kwargs))
+
+    def run_batch(self, tests: list) -> list:
+        """
+        Ejecutar tests independientes en paralelo.
+
+        Args:
+            tests: Tuplas (sección, nombre, endpoint, opciones de _check).
+                Con expect_keys_any en las opciones, nombre es una lista
+                con un nombre por conjunto de keys.
+
+        Returns:
+            JSON de cada entrada en el orden declarado (None si falló su
+            primer test; con expect_keys_any no cuentan los demás conjuntos).
+            El informe se imprime en ese mismo orden.
+        """
+        def run_one(item):
+            _, name, endpoint, options = item
+            if 'expect_keys_any' in options:
+                return self._check_many(name, endpoint, **options)
+            return [(name, *self._check(endpoint, **options))]
+
+        # Un solo pool para todos los lotes: hilos y conexiones se reutilizan
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS,
+                                                thread_name_prefix="smoke")
+        outcomes = list(self._executor.map(run_one, tests))
+
+        results = []
+        current_section = None
+        for (section, *_), records in zip(tests, outcomes):
+            if section != current_section:
+                self.section(section)
+                current_section = section
+            for record in records:
+                self._record(*record)
+            results.append(records[0][1])
+        return results
 
     def _pass(self, name: str):
         self.passed += 1
         self.results.append((name, True, None))
-        print(f"  {GREEN}[OK]{RESET} {name}")
+        print(OK_FMT % name)
 
     def _fail(self, name: str, reason: str):
         self.failed += 1
         self.results.append((name, False, reason))
-        print(f"  {RED}[FAIL]{RESET} {name}: {reason}")
+        print(FAIL_FMT % (name, reason))
 
     def section(self, name: str):
         print(f"\n{BOLD}> {name}{RESET}")
 
     def summary(self):
         total = self.passed + self.failed
-        print(f"\n{'='*50}")
+        # Se acumula todo y se escribe de una vez
+        out = [f"\n{'='*50}"]
         if self.failed == 0:
-            print(f"{GREEN}{BOLD}[OK] TODOS LOS TESTS PASARON ({self.passed}/{total}){RESET}")
+            out.append(f"{GREEN}{BOLD}[OK] TODOS LOS TESTS PASARON ({self.passed}/{total}){RESET}")
         else:
-            print(f"{RED}{BOLD}[FAIL] FALLOS: {self.failed}/{total}{RESET}")
-            print(f"\nTests fallidos:")
+            out.append(f"{RED}{BOLD}[FAIL] FALLOS: {self.failed}/{total}{RESET}")
+            out.append(f"\nTests fallidos:")
             for name, ok, reason in self.results:
                 if not ok:
-                    print(f"  - {name}: {reason}")
-        print()
+                    out.append(f"  - {name}: {reason}")
+        out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
+        self.close()
         return self.failed == 0
 
 
@@ -120,85 +318,66 @@ def run_smoke_tests(base_url: str) -> bool:
 
     t = SmokeTest(base_url)
 
-    # ========================================
-    # CORE API
-    # ========================================
-    t.section("CORE API")
-    t.test("Health check", "/health", expect_keys=["status"])
-    t.test("API root", "/api/scan/list", expect_keys=["scans"])
+    # Servidor caído: un solo error en vez de un timeout por test
+    if not t.is_ready():
+        print(f"\n{RED}{BOLD}[FAIL] Servidor no disponible en {base_url}/health{RESET}\n")
+        t.close()
+        return False
 
     # ========================================
-    # FILE BROWSER (nuevo)
+    # Tests independientes: en paralelo
     # ========================================
-    t.section("FILE BROWSER")
-    t.test("Browse /projects", "/api/browse?path=/projects", expect_keys=["path", "items"])
-    t.test("Browse root", "/api/browse?path=/", expect_keys=["items"])
+    batch = [
+        ("CORE API", "Health check", "/health", {"expect_keys": ["status"]}),
+        ("CORE API", "API root", "/api/scan/list", {"expect_keys": ["scans"]}),
+        ("FILE BROWSER", "Browse /projects", "/api/browse?path=/projects",
+         {"expect_keys": ["path", "items"]}),
+        ("FILE BROWSER", "Browse root", "/api/browse?path=/", {"expect_keys": ["items"]}),
+        ("SCAN API", "List scans", "/api/scan/list", {"expect_keys": ["scans"]}),
+        ("WORKSPACE API", "Workspace status", "/api/workspace",
+         {"expect_keys": ["path", "used_bytes", "limit_bytes"]}),
+        ("RULES API", "List presets", "/api/rules/presets", {"expect_keys": ["presets"]}),
+        ("FRONTEND", "Main page loads", "/", {"expect_status": 200}),
+        ("AI API (Ollama)", ["AI status", "AI models"], "/api/ai/status",
+         {"expect_keys_any": [["available"], ["models"]]}),
+    ]
+    results = t.run_batch(batch)
+    # La lista se reutiliza abajo para elegir el scan de consolidation
+    scan_list = results[4]
+    ai_data = results[8]
 
     # ========================================
-    # SCAN API
+    # AI API: chat secuencial (timeout largo, depende del status)
     # ========================================
-    t.section("SCAN API")
-    t.test("List scans", "/api/scan/list", expect_keys=["scans"])
+    if not isinstance(ai_data, dict):
+        print(WARN_FMT % "Skip AI chat test")
+    elif ai_data.get('available'):
+        t.test("AI chat", "/api/ai/chat", method="POST",
+               data={"message": "test", "model": ai_data.get('default_model', 'qwen2.5-coder:7b')},
+               expect_keys=["response"], timeout=60)
+    else:
+        print(WARN_FMT % "Ollama no disponible, skip chat test")
 
     # ========================================
     # CONSOLIDATION API
     # ========================================
-    t.section("CONSOLIDATION API")
-    # Obtener primer scan para tests
-    try:
-        resp = urlopen(f"{base_url}/api/scan/list", timeout=10)
-        data = json.loads(resp.read())
-        scans = data.get('scans', [])
-        if scans:
-            scan_id = scans[0].get('scan_id')
-            t.test(f"Get siblings (scan {scan_id[:8]})",
-                   f"/api/consolidation/siblings/{scan_id}?limit=10",
-                   expect_keys=["groups", "total"])
-            t.test(f"Get summary (scan {scan_id[:8]})",
-                   f"/api/scan/result/{scan_id}/summary",
-                   expect_keys=["scan_id"])
+    # Primer scan de la lista ya obtenida
+    scans = scan_list.get('scans', []) if isinstance(scan_list, dict) else []
+    scan_id = scans[0].get('scan_id') if scans else None
+    if scan_id:
+        t.run_batch([
+            ("CONSOLIDATION API", f"Get siblings (scan {scan_id[:8]})",
+             f"/api/consolidation/siblings/{scan_id}?limit=10",
+             {"expect_keys": ["groups", "total"]}),
+            ("CONSOLIDATION API", f"Get summary (scan {scan_id[:8]})",
+             f"/api/scan/result/{scan_id}/summary", {"expect_keys": ["scan_id"]}),
+        ])
+    else:
+        t.section("CONSOLIDATION API")
+        if scan_list is None:
+            print(WARN_FMT % "Skip consolidation tests: lista de scans no disponible")
         else:
-            print(f"  {YELLOW}[WARN]{RESET} No hay scans para probar consolidation")
-    except Exception as e:
-        print(f"  {YELLOW}[WARN]{RESET} Skip consolidation tests: {e}")
-
-    # ========================================
-    # AI API
-    # ========================================
-    t.section("AI API (Ollama)")
-    t.test("AI status", "/api/ai/status", expect_keys=["available"])
-    t.test("AI models", "/api/ai/status", expect_keys=["models"])
-
-    # Test chat solo si Ollama está disponible
-    try:
-        resp = urlopen(f"{base_url}/api/ai/status", timeout=5)
-        ai_data = json.loads(resp.read())
-        if ai_data.get('available'):
-            t.test("AI chat", "/api/ai/chat", method="POST",
-                   data={"message": "test", "model": ai_data.get('default_model', 'qwen2.5-coder:7b')},
-                   expect_keys=["response"], timeout=60)
-        else:
-            print(f"  {YELLOW}[WARN]{RESET} Ollama no disponible, skip chat test")
-    except:
-        print(f"  {YELLOW}[WARN]{RESET} Skip AI chat test")
-
-    # ========================================
-    # WORKSPACE API
-    # ========================================
-    t.section("WORKSPACE API")
-    t.test("Workspace status", "/api/workspace", expect_keys=["path", "used_bytes", "limit_bytes"])
-
-    # ========================================
-    # RULES API
-    # ========================================
-    t.section("RULES API")
-    t.test("List presets", "/api/rules/presets", expect_keys=["presets"])
-
-    # ========================================
-    # FRONTEND
-    # ========================================
-    t.section("FRONTEND")
-    t.test("Main page loads", "/", expect_status=200)
+            print(WARN_FMT % "No hay scans para probar consolidation")
 
     # ========================================
     # RESULT
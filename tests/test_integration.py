@@ -3,38 +3,36 @@ HyperMatrix v2026 - Integration Tests
 End-to-end tests for the complete analysis pipeline.
 """
 
-import os
-import shutil
-import tempfile
 import pytest
-from pathlib import Path
 
 from src.core.db_manager import DBManager
 from src.core.analyzer import Analyzer
 from src.core.metrics import MetricsCalculator, calculate_project_metrics
+from src.parsers.parser_sql import SQLParser
+from src.parsers.parser_typescript import TypeScriptParser
+from src.parsers.parser_yaml import YAMLParser
 from src.phases.phase1_discovery import Phase1Discovery
 from src.phases.phase1_5_deduplication import Phase1_5Deduplication
 from src.phases.phase2_analysis import Phase2Analysis
 from src.phases.phase3_consolidation import Phase3Consolidation
 from src.visualization.graph_generator import GraphGenerator, GraphFormat
 
+# API app built once at import; TestClient itself is cheap to create
+try:
+    from fastapi.testclient import TestClient
+    import src.api.dependencies as dependencies
+    from src.api.server import create_app
 
-class TestEndToEndPipeline:
-    """Test complete analysis pipeline."""
-
-    @pytest.fixture
-    def temp_project(self):
-        """Create a temporary project structure."""
-        temp_dir = tempfile.mkdtemp(prefix="hypermatrix_test_")
+    API_APP = create_app(":memory:", debug=True)
+except ImportError:
+    API_APP = None
 
-        # Create Python files
-        src_dir = Path(temp_dir) / "src"
-        src_dir.mkdir()
+# Under pytest-xdist keep this module on one worker so the module-scoped
+# temp_project is built once; other modules still spread across workers.
+pytestmark = pytest.mark.xdist_group(name="integration_pipeline")
 
-        # Main module
-        (src_dir / "__init__.py").write_text("")
 
-        (src_dir / "main.py").write_text('''
+PROJECT_MAIN_PY = '''
 """Main module."""
 from .utils import helper_function
 from .models import User
@@ -47,9 +45,9 @@ def main():
 
 if __name__ == "__main__":
     main()
-''')
+'''
 
-        (src_dir / "utils.py").write_text('''
+PROJECT_UTILS_PY = '''
 """Utility functions."""
 import os
 import json
@@ -75,9 +73,9 @@ class ConfigManager:
 
     def get(self, key: str):
         return self.config.get(key)
-''')
+'''
 
-        (src_dir / "models.py").write_text('''
+PROJECT_MODELS_PY = '''
 """Data models."""
 from dataclasses import dataclass
 
@@ -96,85 +94,101 @@ class Project:
     id: int
     name: str
     owner: User = None
-''')
-
-        # Create test directory
-        tests_dir = Path(temp_dir) / "tests"
-        tests_dir.mkdir()
+'''
 
-        (tests_dir / "test_utils.py").write_text('''
+PROJECT_TEST_UTILS_PY = '''
 """Test utilities."""
 import pytest
 from src.utils import helper_function
 
 def test_helper_function():
     assert helper_function("test") == "TEST"
-''')
+'''
 
-        # Create config files
-        (Path(temp_dir) / "config.json").write_text('{"debug": true}')
-        (Path(temp_dir) / "README.md").write_text("# Test Project\\n\\nThis is a test.")
 
-        yield temp_dir
+@pytest.fixture(scope="module")
+def temp_project(tmp_path_factory):
+    """
+    Create a temporary project structure.
 
-        # Cleanup
-        shutil.rmtree(temp_dir)
+    Module-scoped: the pipeline tests only read the tree, so it is built once.
+    """
+    temp_dir = tmp_path_factory.mktemp("hypermatrix_test_")
 
-    @pytest.fixture
-    def temp_db(self):
-        """Create a temporary database."""
-        fd, path = tempfile.mkstemp(suffix=".db")
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.remove(path)
-
-    def test_full_pipeline(self, temp_project, temp_db):
-        """Test complete analysis pipeline."""
-        # Initialize
-        db = DBManager(temp_db)
+    # Create Python files
+    src_dir = temp_dir / "src"
+    src_dir.mkdir()
 
-        # Phase 1: Discovery
-        discovery = Phase1Discovery()
-        discovery_result = discovery.scan_directory(temp_project)
+    # Main module
+    (src_dir / "__init__.py").write_text("")
+    (src_dir / "main.py").write_text(PROJECT_MAIN_PY)
+    (src_dir / "utils.py").write_text(PROJECT_UTILS_PY)
+    (src_dir / "models.py").write_text(PROJECT_MODELS_PY)
 
-        assert len(discovery_result.files) >= 5  # At least our created files
+    # Create test directory
+    tests_dir = temp_dir / "tests"
+    tests_dir.mkdir()
+    (tests_dir / "test_utils.py").write_text(PROJECT_TEST_UTILS_PY)
 
-        # Phase 1.5: Deduplication
-        dedup = Phase1_5Deduplication()
-        dedup_result = dedup.process(discovery_result)
+    # Create config files
+    (temp_dir / "config.json").write_text('{"debug": true}')
+    (temp_dir / "README.md").write_text("# Test Project\\n\\nThis is a test.")
 
-        assert dedup_result.unique_files >= 5
+    return str(temp_dir)
 
-        # Phase 2: Analysis
-        analysis = Phase2Analysis(db)
-        phase2_result = analysis.analyze_all_files(discovery_result, dedup_result, "TestProject")
+
+@pytest.fixture(scope="module")
+def analyzed_project(temp_project, tmp_path_factory):
+    """
+    Run discovery, deduplication and analysis once on temp_project.
+
+    The pipeline tests only differ in what they check afterwards, so they
+    share this result instead of re-running phases 1-2 each.
+    """
+    db = DBManager(str(tmp_path_factory.mktemp("pipeline_db") / "test.db"), fast=True)
+
+    # Phase 1: Discovery
+    discovery_result = Phase1Discovery().scan_directory(temp_project)
+
+    # Phase 1.5: Deduplication
+    dedup_result = Phase1_5Deduplication().process(discovery_result)
+
+    # Phase 2: Analysis
+    analysis = Phase2Analysis(db)
+    phase2_result = analysis.analyze_all_files(discovery_result, dedup_result, "TestProject")
+
+    return {
+        "db": db,
+        "discovery": discovery_result,
+        "dedup": dedup_result,
+        "analysis": analysis,
+        "phase2": phase2_result,
+    }
+
+
+class TestEndToEndPipeline:
+    """Test complete analysis pipeline."""
+
+    def test_full_pipeline(self, analyzed_project):
+        """Test complete analysis pipeline."""
+        db = analyzed_project["db"]
+
+        assert len(analyzed_project["discovery"].files) >= 5  # At least our created files
+        assert analyzed_project["dedup"].unique_files >= 5
 
         # Verify database records
-        stats = db.get_statistics(analysis._project_id)
+        stats = db.get_statistics(analyzed_project["analysis"]._project_id)
 
         assert stats["total_files"] >= 5
         assert stats["total_functions"] >= 4  # main, helper_function, load_config, greet
         assert stats["total_classes"] >= 3   # ConfigManager, User, Project
         assert stats["total_imports"] >= 3   # os, json, dataclasses
 
-    def test_metrics_calculation(self, temp_project, temp_db):
+    def test_metrics_calculation(self, analyzed_project):
         """Test metrics calculation on analyzed project."""
-        db = DBManager(temp_db)
-
-        # Run discovery and analysis
-        discovery = Phase1Discovery()
-        discovery_result = discovery.scan_directory(temp_project)
-
-        dedup = Phase1_5Deduplication()
-        dedup_result = dedup.process(discovery_result)
-
-        analysis = Phase2Analysis(db)
-        phase2_result = analysis.analyze_all_files(discovery_result, dedup_result, "MetricsTest")
-
         # Calculate metrics
         calculator = MetricsCalculator()
-        python_files = [f.filepath for f in discovery_result.files
+        python_files = [f.filepath for f in analyzed_project["discovery"].files
                        if f.filepath.endswith('.py')]
 
         for filepath in python_files:
@@ -187,23 +201,12 @@ def test_helper_function():
         assert project_metrics.total_files > 0
         assert project_metrics.total_loc > 0
 
-    def test_graph_generation(self, temp_project, temp_db):
+    def test_graph_generation(self, temp_project, analyzed_project):
         """Test dependency graph generation."""
-        db = DBManager(temp_db)
-
-        # Run discovery and analysis
-        discovery = Phase1Discovery()
-        discovery_result = discovery.scan_directory(temp_project)
-
-        dedup = Phase1_5Deduplication()
-        dedup_result = dedup.process(discovery_result)
-
-        analysis = Phase2Analysis(db)
-        phase2_result = analysis.analyze_all_files(discovery_result, dedup_result, "GraphTest")
-
         # Generate graph
         graph_gen = GraphGenerator(temp_project)
-        graph_gen.build_from_database(db, analysis._project_id)
+        graph_gen.build_from_database(analyzed_project["db"],
+                                      analyzed_project["analysis"]._project_id)
 
         # Test different formats
         dot_output = graph_gen.to_dot()
@@ -222,13 +225,20 @@ class TestDatabaseIntegration:
 
     @pytest.fixture
     def db(self):
-        """Create temporary database."""
-        fd, path = tempfile.mkstemp(suffix=".db")
-        os.close(fd)
-        db = DBManager(path)
-        yield db
-        if os.path.exists(path):
-            os.remove(path)
+        """Create in-memory database."""
+        return DBManager(":memory:")
+
+    def test_memory_database_persists_across_connections(self, db):
+        """Test ":memory:" keeps schema and rows between operations."""
+        project_id = db.create_project("MemoryTest", "/test")
+
+        project = db.get_project(project_id)
+        assert project is not None
+        assert project["name"] == "MemoryTest"
+
+        # Separate in-memory managers do not share data
+        other = DBManager(":memory:")
+        assert other.get_project(project_id) is None
 
     @pytest.mark.skip(reason="DBManager.list_projects() not implemented")
     def test_project_lifecycle(self, db):
@@ -303,12 +313,12 @@ class TestParserIntegration:
     """Test parser integration with analysis pipeline."""
 
     @pytest.fixture
-    def temp_files(self):
-        """Create temporary test files."""
-        temp_dir = tempfile.mkdtemp()
+    def temp_files(self, tmp_path):
+        """Create temporary test files (removed later by pytest's tmp_path reaper)."""
+        temp_dir = str(tmp_path)
 
         # TypeScript file
-        ts_file = Path(temp_dir) / "app.ts"
+        ts_file = tmp_path / "app.ts"
         ts_file.write_text('''
 interface User {
     id: number;
@@ -329,7 +339,7 @@ export class UserService {
 ''')
 
         # YAML file
-        yaml_file = Path(temp_dir) / "docker-compose.yml"
+        yaml_file = tmp_path / "docker-compose.yml"
         yaml_file.write_text('''
 version: "3.8"
 services:
@@ -346,7 +356,7 @@ services:
 ''')
 
         # SQL file
-        sql_file = Path(temp_dir) / "schema.sql"
+        sql_file = tmp_path / "schema.sql"
         sql_file.write_text('''
 CREATE TABLE users (
     id SERIAL PRIMARY KEY,
@@ -365,19 +375,15 @@ CREATE TABLE posts (
 CREATE INDEX idx_posts_user ON posts(user_id);
 ''')
 
-        yield {
+        return {
             "dir": temp_dir,
             "ts": str(ts_file),
             "yaml": str(yaml_file),
             "sql": str(sql_file),
         }
 
-        shutil.rmtree(temp_dir)
-
     def test_typescript_parsing(self, temp_files):
         """Test TypeScript parser integration."""
-        from src.parsers.parser_typescript import TypeScriptParser
-
         parser = TypeScriptParser(temp_files["ts"])
         result = parser.parse()
 
@@ -393,8 +399,6 @@ CREATE INDEX idx_posts_user ON posts(user_id);
 
     def test_yaml_parsing(self, temp_files):
         """Test YAML parser integration."""
-        from src.parsers.parser_yaml import YAMLParser
-
         parser = YAMLParser(temp_files["yaml"])
         result = parser.parse()
 
@@ -407,8 +411,6 @@ CREATE INDEX idx_posts_user ON posts(user_id);
 
     def test_sql_parsing(self, temp_files):
         """Test SQL parser integration."""
-        from src.parsers.parser_sql import SQLParser
-
         parser = SQLParser(temp_files["sql"])
         result = parser.parse()
 
@@ -425,17 +427,18 @@ CREATE INDEX idx_posts_user ON posts(user_id);
 class TestAPIIntegration:
     """Test API integration (requires running server)."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def client(self):
-        """Create test client."""
-        try:
-            from fastapi.testclient import TestClient
-            from src.api.server import create_app
-
-            app = create_app(":memory:", debug=True)
-            return TestClient(app)
-        except ImportError:
+        """Create test client on the shared API_APP."""
+        if API_APP is None:
             pytest.skip("FastAPI not installed")
+        return TestClient(API_APP)
+
+    @pytest.fixture(autouse=True)
+    def fresh_db(self, monkeypatch):
+        """Give each test its own in-memory database, restored afterwards."""
+        if API_APP is not None:
+            monkeypatch.setattr(dependencies, "_db_manager", DBManager(":memory:"))
 
     def test_health_endpoint(self, client):
         """Test health check endpoint."""
@@ -468,13 +471,13 @@ class TestConsolidationIntegration:
     """Test consolidation phase integration."""
 
     @pytest.fixture
-    def temp_siblings(self):
-        """Create files with similar content."""
-        temp_dir = tempfile.mkdtemp()
+    def temp_siblings(self, tmp_path_factory):
+        """Create files with similar content (removed later by pytest's tmp_path reaper)."""
+        temp_dir = tmp_path_factory.mktemp("siblings")
 
         # Create similar files
         for i in range(3):
-            filepath = Path(temp_dir) / f"utils_v{i+1}.py"
+            filepath = temp_dir / f"utils_v{i+1}.py"
             filepath.write_text(f'''
 """Utility module version {i+1}."""
 
@@ -487,36 +490,29 @@ def another_helper(y):
     return y + 1
 ''')
 
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+        return str(temp_dir)
 
-    def test_sibling_detection(self, temp_siblings):
+    def test_sibling_detection(self, temp_siblings, tmp_path):
         """Test detection of similar files."""
-        db_path = tempfile.mktemp(suffix=".db")
-        db = DBManager(db_path)
-
-        try:
-            # Run discovery and analysis
-            discovery = Phase1Discovery()
-            discovery_result = discovery.scan_directory(temp_siblings)
+        db = DBManager(str(tmp_path / "test.db"), fast=True)
 
-            dedup = Phase1_5Deduplication()
-            dedup_result = dedup.process(discovery_result)
-
-            analysis = Phase2Analysis(db)
-            phase2_result = analysis.analyze_all_files(discovery_result, dedup_result, "SiblingTest")
+        # Run discovery and analysis
+        discovery = Phase1Discovery()
+        discovery_result = discovery.scan_directory(temp_siblings)
 
-            # Run consolidation
-            consolidation = Phase3Consolidation(db)
-            phase3_result = consolidation.consolidate(discovery_result, phase2_result, analysis._project_id)
+        dedup = Phase1_5Deduplication()
+        dedup_result = dedup.process(discovery_result)
 
-            # Should detect similar files
-            # (Detection depends on name similarity and content)
-            assert isinstance(phase3_result.groups, dict)
+        analysis = Phase2Analysis(db)
+        phase2_result = analysis.analyze_all_files(discovery_result, dedup_result, "SiblingTest")
 
-        finally:
-            os.remove(db_path)
+        # Run consolidation
+        consolidation = Phase3Consolidation(db)
+        phase3_result = consolidation.consolidate(discovery_result, phase2_result, analysis._project_id)
 
+        # Should detect similar files
+        # (Detection depends on name similarity and content)
+        assert isinstance(phase3_result.groups, dict)
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
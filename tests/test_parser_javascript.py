@@ -16,6 +16,18 @@ from src.parsers import (
 )
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """Shared parser: parse() starts from a fresh JSParseResult on every call."""
+    return JavaScriptParser()
+
+
+@pytest.fixture(scope="module")
+def sample_result(parser, sample_javascript_code):
+    """sample_javascript_code parsed once; parse() never mutates a returned result."""
+    return parser.parse(sample_javascript_code)
+
+
 class TestJavaScriptParser:
     """Tests for JavaScriptParser class."""
 
@@ -24,15 +36,12 @@ class TestJavaScriptParser:
         parser = JavaScriptParser()
         assert parser is not None
 
-    def test_parse_returns_result(self, sample_javascript_code):
+    def test_parse_returns_result(self, sample_result):
         """Test parse returns JSParseResult."""
-        parser = JavaScriptParser()
-        result = parser.parse(sample_javascript_code)
-        assert isinstance(result, JSParseResult)
+        assert isinstance(sample_result, JSParseResult)
 
-    def test_parse_empty_code(self):
+    def test_parse_empty_code(self, parser):
         """Test parsing empty code."""
-        parser = JavaScriptParser()
         result = parser.parse("")
         assert isinstance(result, JSParseResult)
         assert len(result.functions) == 0
@@ -42,14 +51,13 @@ class TestJavaScriptParser:
 class TestFunctionExtraction:
     """Tests for JavaScript function extraction."""
 
-    def test_extract_simple_function(self):
+    def test_extract_simple_function(self, parser):
         """Test extracting a simple function."""
         code = '''
 function hello(name) {
     return "Hello, " + name;
 }
 '''
-        parser = JavaScriptParser()
         result = parser.parse(code)
 
         assert len(result.functions) >= 1
@@ -57,71 +65,45 @@ function hello(name) {
         assert func is not None
         assert "name" in func.params
 
-    def test_extract_async_function(self):
-        """Test extracting async function."""
-        code = '''
+    @pytest.mark.parametrize("code, name, flags", [
+        pytest.param('''
 async function fetchData(url) {
     const response = await fetch(url);
     return response.json();
 }
-'''
-        parser = JavaScriptParser()
-        result = parser.parse(code)
-
-        func = next((f for f in result.functions if f.name == "fetchData"), None)
-        assert func is not None
-        assert func.is_async is True
-
-    def test_extract_generator_function(self):
-        """Test extracting generator function."""
-        code = '''
+''', "fetchData", {"is_async": True}, id="async_function"),
+        pytest.param('''
 function* generator(n) {
     for (let i = 0; i < n; i++) {
         yield i;
     }
 }
-'''
-        parser = JavaScriptParser()
-        result = parser.parse(code)
-
-        func = next((f for f in result.functions if f.name == "generator"), None)
-        assert func is not None
-        assert func.is_generator is True
-
-    def test_extract_arrow_function(self):
-        """Test extracting arrow function."""
-        code = '''
+''', "generator", {"is_generator": True}, id="generator_function"),
+        pytest.param('''
 const greet = (name) => {
     return `Hello, ${name}!`;
 };
-'''
-        parser = JavaScriptParser()
-        result = parser.parse(code)
-
-        func = next((f for f in result.functions if f.name == "greet"), None)
-        assert func is not None
-        assert func.is_arrow is True
-
-    def test_extract_async_arrow_function(self):
-        """Test extracting async arrow function."""
-        code = '''
+''', "greet", {"is_arrow": True}, id="arrow_function"),
+        pytest.param('''
 const fetchUser = async (id) => {
     return await api.getUser(id);
 };
-'''
-        parser = JavaScriptParser()
+''', "fetchUser", {"is_async": True, "is_arrow": True}, id="async_arrow_function"),
+    ])
+    def test_extract_function_kind(self, parser, code, name, flags):
+        """Test extracting async, generator and arrow functions."""
         result = parser.parse(code)
 
-        func = next((f for f in result.functions if f.name == "fetchUser"), None)
+        func = next((f for f in result.functions if f.name == name), None)
         assert func is not None
-        assert func.is_async is True
-        assert func.is_arrow is True
+        for attr, expected in flags.items():
+            assert getattr(func, attr) is expected
 
 
 class TestClassExtraction:
     """Tests for JavaScript class extraction."""
 
-    def test_extract_simple_class(self):
+    def test_extract_simple_class(self, parser):
         """Test extracting a simple class."""
         code = '''
 class MyClass {
@@ -134,7 +116,6 @@ class MyClass {
     }
 }
 '''
-        parser = JavaScriptParser()
         result = parser.parse(code)
 
         assert len(result.classes) == 1
@@ -143,7 +124,7 @@ class MyClass {
         assert "constructor" in cls.methods
         assert "getValue" in cls.methods
 
-    def test_extract_class_with_extends(self):
+    def test_extract_class_with_extends(self, parser):
         """Test extracting class with inheritance."""
         code = '''
 class ChildClass extends ParentClass {
@@ -152,7 +133,6 @@ class ChildClass extends ParentClass {
     }
 }
 '''
-        parser = JavaScriptParser()
         result = parser.parse(code)
 
         assert len(result.classes) == 1
@@ -160,7 +140,7 @@ class ChildClass extends ParentClass {
         assert cls.name == "ChildClass"
         assert cls.extends == "ParentClass"
 
-    def test_extract_class_with_static_method(self):
+    def test_extract_class_with_static_method(self, parser):
         """Test extracting class with static methods."""
         code = '''
 class Utility {
@@ -173,7 +153,6 @@ class Utility {
     }
 }
 '''
-        parser = JavaScriptParser()
         result = parser.parse(code)
 
         cls = result.classes[0]
@@ -184,73 +163,59 @@ class Utility {
 class TestImportExtraction:
     """Tests for JavaScript import extraction."""
 
-    def test_extract_default_import(self):
-        """Test extracting default import."""
-        code = "import React from 'react';"
-        parser = JavaScriptParser()
+    @pytest.mark.parametrize("code, module, flag", [
+        pytest.param("import React from 'react';", "react", "is_default", id="default"),
+        pytest.param("import * as utils from './utils';", "./utils", "is_namespace",
+                     id="namespace"),
+    ])
+    def test_extract_import_kind(self, parser, code, module, flag):
+        """Test extracting default and namespace imports."""
         result = parser.parse(code)
 
         assert len(result.imports) >= 1
-        imp = next((i for i in result.imports if i.module == "react"), None)
+        imp = next((i for i in result.imports if i.module == module), None)
         assert imp is not None
-        assert imp.is_default is True
+        assert getattr(imp, flag) is True
 
-    def test_extract_named_imports(self):
+    def test_extract_named_imports(self, parser):
         """Test extracting named imports."""
         code = "import { useState, useEffect } from 'react';"
-        parser = JavaScriptParser()
         result = parser.parse(code)
 
         imp = next((i for i in result.imports if i.module == "react"), None)
         assert imp is not None
         assert "useState" in imp.names or "useEffect" in imp.names
 
-    def test_extract_namespace_import(self):
-        """Test extracting namespace import."""
-        code = "import * as utils from './utils';"
-        parser = JavaScriptParser()
-        result = parser.parse(code)
-
-        imp = next((i for i in result.imports if i.module == "./utils"), None)
-        assert imp is not None
-        assert imp.is_namespace is True
-
-    def test_extract_multiple_imports(self, sample_javascript_code):
+    def test_extract_multiple_imports(self, sample_result):
         """Test extracting multiple imports."""
-        parser = JavaScriptParser()
-        result = parser.parse(sample_javascript_code)
-
-        assert len(result.imports) >= 2
+        assert len(sample_result.imports) >= 2
 
 
 class TestExportExtraction:
     """Tests for JavaScript export extraction."""
 
-    def test_extract_default_export(self):
+    def test_extract_default_export(self, parser):
         """Test extracting default export."""
         code = "export default MyClass;"
-        parser = JavaScriptParser()
         result = parser.parse(code)
 
         exports = [e for e in result.exports if e.is_default]
         assert len(exports) >= 1
 
-    def test_extract_named_export(self):
+    def test_extract_named_export(self, parser):
         """Test extracting named exports."""
         code = "export { foo, bar };"
-        parser = JavaScriptParser()
         result = parser.parse(code)
 
         assert len(result.exports) >= 1
 
-    def test_extract_export_function(self):
+    def test_extract_export_function(self, parser):
         """Test extracting exported function."""
         code = '''
 export function helper() {
     return true;
 }
 '''
-        parser = JavaScriptParser()
         result = parser.parse(code)
 
         export = next((e for e in result.exports if e.name == "helper"), None)
@@ -260,56 +225,38 @@ export function helper() {
 class TestVariableExtraction:
     """Tests for JavaScript variable extraction."""
 
-    def test_extract_const(self):
-        """Test extracting const declaration."""
-        code = "const API_URL = 'https://api.example.com';"
-        parser = JavaScriptParser()
-        result = parser.parse(code)
-
-        var = next((v for v in result.variables if v.name == "API_URL"), None)
-        assert var is not None
-        assert var.kind == "const"
-
-    def test_extract_let(self):
-        """Test extracting let declaration."""
-        code = "let counter = 0;"
-        parser = JavaScriptParser()
-        result = parser.parse(code)
-
-        var = next((v for v in result.variables if v.name == "counter"), None)
-        assert var is not None
-        assert var.kind == "let"
-
-    def test_extract_var(self):
-        """Test extracting var declaration."""
-        code = "var oldStyle = true;"
-        parser = JavaScriptParser()
+    @pytest.mark.parametrize("code, name, kind", [
+        pytest.param("const API_URL = 'https://api.example.com';", "API_URL", "const",
+                     id="const"),
+        pytest.param("let counter = 0;", "counter", "let", id="let"),
+        pytest.param("var oldStyle = true;", "oldStyle", "var", id="var"),
+    ])
+    def test_extract_declaration(self, parser, code, name, kind):
+        """Test extracting const, let and var declarations."""
         result = parser.parse(code)
 
-        var = next((v for v in result.variables if v.name == "oldStyle"), None)
+        var = next((v for v in result.variables if v.name == name), None)
         assert var is not None
-        assert var.kind == "var"
+        assert var.kind == kind
 
 
 class TestDataFlowExtraction:
     """Tests for JavaScript data flow extraction."""
 
-    def test_extract_write_operation(self):
+    def test_extract_write_operation(self, parser):
         """Test extracting WRITE data flow."""
         code = "let x = 10;"
-        parser = JavaScriptParser()
         result = parser.parse(code)
 
         writes = [df for df in result.data_flow if df.flow_type == JSDataFlowType.WRITE]
         assert any(df.variable == "x" for df in writes)
 
-    def test_extract_read_operation(self):
+    def test_extract_read_operation(self, parser):
         """Test extracting READ data flow."""
         code = '''
 let x = 10;
 let y = x + 5;
 '''
-        parser = JavaScriptParser()
         result = parser.parse(code)
 
         reads = [df for df in result.data_flow if df.flow_type == JSDataFlowType.READ]
@@ -319,20 +266,18 @@ let y = x + 5;
 class TestParseFile:
     """Tests for file parsing."""
 
-    def test_parse_file(self, create_temp_file, sample_javascript_code):
+    def test_parse_file(self, parser, create_temp_file, sample_javascript_code):
         """Test parsing a JavaScript file."""
         filepath = create_temp_file("test_module.js", sample_javascript_code)
 
-        parser = JavaScriptParser()
         result = parser.parse_file(filepath)
 
         assert isinstance(result, JSParseResult)
         assert len(result.functions) > 0
         assert len(result.classes) > 0
 
-    def test_parse_file_not_found(self):
+    def test_parse_file_not_found(self, parser):
         """Test parsing non-existent file raises error."""
-        parser = JavaScriptParser()
 
         with pytest.raises(FileNotFoundError):
             parser.parse_file("nonexistent_file.js")
@@ -341,47 +286,34 @@ class TestParseFile:
 class TestEdgeCases:
     """Tests for edge cases."""
 
-    def test_anonymous_function(self):
-        """Test anonymous function in callback."""
-        code = '''
+    @pytest.mark.parametrize("code", [
+        pytest.param('''
 array.map(function(item) {
     return item * 2;
 });
-'''
-        parser = JavaScriptParser()
-        result = parser.parse(code)
-
-        # Anonymous functions may or may not be captured
-        assert isinstance(result, JSParseResult)
-
-    def test_iife(self):
-        """Test Immediately Invoked Function Expression."""
-        code = '''
+''', id="anonymous_function"),
+        pytest.param('''
 (function() {
     console.log("IIFE");
 })();
-'''
-        parser = JavaScriptParser()
-        result = parser.parse(code)
-        assert isinstance(result, JSParseResult)
-
-    def test_object_method_shorthand(self):
-        """Test object method shorthand."""
-        code = '''
+''', id="iife"),
+        pytest.param('''
 const obj = {
     method() {
         return true;
     }
 };
-'''
-        parser = JavaScriptParser()
+''', id="object_method_shorthand"),
+    ])
+    def test_unnamed_function_forms_parse(self, parser, code):
+        """Test anonymous callbacks, IIFEs and method shorthand don't break parsing."""
+        # These may or may not be captured as functions
         result = parser.parse(code)
         assert isinstance(result, JSParseResult)
 
-    def test_destructuring_not_captured_as_function(self):
+    def test_destructuring_not_captured_as_function(self, parser):
         """Test destructuring doesn't create false function."""
         code = "const { a, b } = obj;"
-        parser = JavaScriptParser()
         result = parser.parse(code)
 
         # Should not create functions named 'a' or 'b'
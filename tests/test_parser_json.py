@@ -45,6 +45,13 @@ class TestJSONParser:
         assert result.is_valid is True
         assert result.root_type == JSONValueType.ARRAY
 
+    def test_parse_bytes(self):
+        """Test parsing UTF-8 bytes gives the same structure as str."""
+        parser = JSONParser()
+        result = parser.parse('{"name": "café", "n": 1}'.encode("utf-8"))
+        assert result.is_valid is True
+        assert [k.key for k in result.keys] == ["name", "n"]
+
 
 class TestValidation:
     """Tests for JSON validation."""
@@ -70,6 +77,16 @@ class TestValidation:
         assert result.is_valid is False
         assert result.error_message is not None
 
+    def test_invalid_utf8_bytes(self):
+        """Test bytes that are not valid UTF-8 are reported as invalid."""
+        parser = JSONParser()
+        result = parser.parse(b'{"a": "\xff"}')
+        assert result.is_valid is False
+        assert result.error_message is not None
+        is_valid, error = parser.validate(b'{"a": "\xff"}')
+        assert is_valid is False
+        assert error is not None
+
 
 class TestKeyExtraction:
     """Tests for key extraction."""
@@ -114,6 +114,20 @@ class TestLinkExtraction:
         assert len(links) == 1
         assert links[0].title == "Title text"
 
+    def test_image_inside_link_not_split(self):
+        """Test a badge link wrapping an image yields no bogus link."""
+        content = "[![Build](badge.svg)](https://ci/link)"
+        parser = MarkdownParser()
+        result = parser.parse(content)
+
+        links = [l for l in result.links if not l.is_image]
+        assert all(l.url != "badge.svg" for l in links)
+        assert all(not l.text.startswith("![") for l in links)
+
+        images = [l for l in result.links if l.is_image]
+        assert len(images) == 1
+        assert images[0].url == "badge.svg"
+
     def test_extract_image(self):
         """Test extracting image reference."""
         content = '![Alt text](image.png "Image title")'
@@ -381,7 +395,6 @@ class TestEdgeCases:
 
         assert len(result.code_blocks) == 0
 
-    @pytest.mark.xfail(reason="Regex parser doesn't exclude code block content")
     def test_heading_in_code_block(self):
         """Test heading inside code block is not extracted."""
         content = '''
@@ -396,7 +409,20 @@ class TestEdgeCases:
         heading_texts = [h.text for h in result.headings]
         assert "Not a real heading" not in heading_texts
 
-    @pytest.mark.xfail(reason="Regex parser doesn't exclude code block content")
+    def test_table_in_code_block(self):
+        """Test table inside code block is not extracted."""
+        content = '''
+```markdown
+| Name | Value |
+|------|-------|
+| a    | 1     |
+```
+'''
+        parser = MarkdownParser()
+        result = parser.parse(content)
+
+        assert len(result.tables) == 0
+
     def test_link_in_code_block(self):
         """Test link inside code block is not extracted."""
         content = '''